@@ -2,46 +2,62 @@
 Configuration module for the Translation API
 """
 import os
-from dotenv import load_dotenv
+from functools import lru_cache
 
-# Load environment variables
-load_dotenv("config.env")
+from dotenv import load_dotenv
 
 
 class Settings:
     """Application settings"""
 
-    # API Configuration — Chipp AI (existing text translation)
-    api_key: str = os.getenv("API_KEY", "")
-    chipp_base_url: str = os.getenv("CHIPP_BASE_URL", "https://app.chipp.ai/api/v1/chat/completions")
-    chipp_model: str = os.getenv("CHIPP_MODEL", "translationforfree-10024994")
-
-    # API Configuration — Gemini (subtitle translation)
-    gemini_api_key: str = os.getenv("GEMINI_API_KEY", "")
-
-    # Server Configuration
-    debug: bool = os.getenv("DEBUG", "False").lower() == "true"
-    host: str = os.getenv("HOST", "0.0.0.0")
-    port: int = int(os.getenv("PORT", "8000"))
-
     # Application Configuration
     app_name: str = "Translation API"
     app_version: str = "1.1.0"
     description: str = "A FastAPI-based translation service"
 
     # CORS Configuration — locked to known origins
-    allowed_origins: list = [
+    allowed_origins: tuple = (
         "https://translationforfree.com",
         "http://localhost:8080",
         "http://localhost:5173",
-    ]
-    allowed_methods: list = ["GET", "POST"]
-    allowed_headers: list = ["*"]
+    )
+    allowed_methods: tuple = ("GET", "POST")
+    allowed_headers: tuple = ("*",)
+    # Let browsers cache preflight responses (they cap this — Chrome at 2h)
+    cors_max_age: int = 86400
+
+    def __init__(self):
+        # API Configuration — Chipp AI (existing text translation)
+        self.api_key: str = os.getenv("API_KEY", "")
+        self.chipp_base_url: str = os.getenv("CHIPP_BASE_URL", "https://app.chipp.ai/api/v1/chat/completions")
+        self.chipp_model: str = os.getenv("CHIPP_MODEL", "translationforfree-10024994")
+
+        # API Configuration — Gemini (subtitle translation)
+        self.gemini_api_key: str = os.getenv("GEMINI_API_KEY", "")
+        self.gemini_max_concurrency: int = int(os.getenv("GEMINI_MAX_CONCURRENCY", "8"))
+
+        # Server Configuration
+        self.debug: bool = os.getenv("DEBUG", "False").lower() == "true"
+        self.host: str = os.getenv("HOST", "0.0.0.0")
+        self.port: int = int(os.getenv("PORT", "8000"))
+
+        if self.gemini_max_concurrency < 1:
+            raise ValueError("GEMINI_MAX_CONCURRENCY must be at least 1")
 
     @property
     def is_production(self) -> bool:
         return not self.debug
 
 
-# Global settings instance
-settings = Settings()
+def _load_env_file() -> None:
+    """Load config.env once per process, even across reloads."""
+    if not os.environ.get("_DOTENV_LOADED"):
+        load_dotenv("config.env")
+        os.environ["_DOTENV_LOADED"] = "1"
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the cached settings instance."""
+    _load_env_file()
+    return Settings()
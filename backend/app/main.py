@@ -2,11 +2,15 @@
 Main FastAPI application
 """
 import logging
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
 from contextlib import asynccontextmanager
 
-from app.config import settings
+import orjson
+
+from app.config import get_settings
 from app.models import (
     TranslationRequest,
     TranslationResponse,
@@ -21,13 +25,15 @@ from app.models import (
     TransliterationResponse,
 )
 from app.services import (
-    translation_service,
-    subtitle_translation_service,
-    text_translation_service,
-    language_detection_service,
-    transliteration_service,
+    get_translation_service,
+    get_subtitle_translation_service,
+    get_text_translation_service,
+    get_language_detection_service,
+    get_transliteration_service,
 )
 
+settings = get_settings()
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO if settings.debug else logging.WARNING,
@@ -38,9 +44,12 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    logger.info(f"Starting {settings.app_name} v{settings.app_version}")
+    logger.info("Starting %s v%s", settings.app_name, settings.app_version)
     yield
     logger.info("Shutting down application")
+    # Only close the Chipp client if a request actually created it
+    if get_translation_service.cache_info().currsize:
+        await get_translation_service().aclose()
 
 
 # Create FastAPI app
@@ -59,31 +68,43 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=settings.allowed_methods,
     allow_headers=settings.allowed_headers,
+    max_age=settings.cors_max_age,
 )
 
+# Compress larger responses — subtitle payloads are big and highly repetitive
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
-@app.get("/health", response_model=HealthResponse)
-async def health_check():
-    return HealthResponse(
+
+# The health payload never changes within a process, so serialize it once
+_HEALTH_BODY = orjson.dumps(
+    HealthResponse(
         status="healthy",
         version=settings.app_version,
         message="Translation API is running",
-    )
+    ).model_dump()
+)
+
+
+@app.get("/health", responses={200: {"model": HealthResponse}})
+async def health_check():
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.post("/translate", response_model=TranslationResponse)
 async def translate_text(request: TranslationRequest):
     """Translate text from source language to target language (Chipp AI)."""
     try:
-        logger.info(f"Translation request: {request.source_language} -> {request.target_language}")
+        logger.info(
+            "Translation request: %s -> %s", request.source_language, request.target_language
+        )
 
-        success, translated_text, error_message = await translation_service.translate(
+        success, translated_text, error_message = await get_translation_service().translate(
             text=request.text,
             source_language=request.source_language,
             target_language=request.target_language,
         )
 
-        return TranslationResponse(
+        return TranslationResponse.model_construct(
             success=success,
             translated_text=translated_text,
             source_language=request.source_language,
@@ -93,7 +114,7 @@ async def translate_text(request: TranslationRequest):
         )
 
     except Exception as e:
-        logger.error(f"Unexpected error in translate endpoint: {e}")
+        logger.error("Unexpected error in translate endpoint: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -102,43 +123,77 @@ async def translate_subtitles(request: SubtitleTranslationRequest):
     """Translate subtitle cues via Gemini API (server-side, key never exposed)."""
     try:
         logger.info(
-            f"Subtitle translation: {len(request.cues)} cues, "
-            f"{request.source_language} -> {request.target_language}"
+            "Subtitle translation: %d cues, %s -> %s",
+            len(request.cues),
+            request.source_language,
+            request.target_language,
         )
 
-        translated_cues = await subtitle_translation_service.translate_subtitles(
+        translated_cues = await get_subtitle_translation_service().translate_subtitles(
             cues=request.cues,
             source_language=request.source_language,
             target_language=request.target_language,
             batch_size=request.batch_size,
         )
 
-        return SubtitleTranslationResponse(success=True, translated_cues=translated_cues)
+        # Cues are built server-side, so skip re-validating each one
+        return SubtitleTranslationResponse.model_construct(success=True, translated_cues=translated_cues)
 
     except Exception as e:
-        logger.error(f"Subtitle translation failed: {e}")
-        return SubtitleTranslationResponse(
+        logger.error("Subtitle translation failed: %s", e)
+        return SubtitleTranslationResponse.model_construct(
             success=False,
             error_message=str(e),
         )
 
 
+@app.post("/translate/subtitle/stream")
+async def translate_subtitles_stream(request: SubtitleTranslationRequest):
+    """Translate subtitle cues, streaming one NDJSON line per finished batch."""
+    logger.info(
+        "Streaming subtitle translation: %d cues, %s -> %s",
+        len(request.cues),
+        request.source_language,
+        request.target_language,
+    )
+
+    async def generate():
+        try:
+            async for translated in get_subtitle_translation_service().translate_subtitles_iter(
+                cues=request.cues,
+                source_language=request.source_language,
+                target_language=request.target_language,
+                batch_size=request.batch_size,
+            ):
+                yield orjson.dumps(
+                    {"success": True, "translated_cues": [cue.model_dump() for cue in translated]}
+                ) + b"\n"
+        except Exception as e:
+            # Headers are already sent, so report the failure as the final line
+            logger.error("Streaming subtitle translation failed: %s", e)
+            yield orjson.dumps({"success": False, "error_message": str(e)}) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @app.post("/translate/text", response_model=TextTranslationResponse)
 async def translate_text_gemini(request: TextTranslationRequest):
     """Translate plain text via Gemini API."""
     try:
         logger.info(
-            f"Text translation: {request.source_language} -> {request.target_language} "
-            f"({len(request.text)} chars)"
+            "Text translation: %s -> %s (%d chars)",
+            request.source_language,
+            request.target_language,
+            len(request.text),
         )
 
-        success, translated_text, error_message = await text_translation_service.translate(
+        success, translated_text, error_message = await get_text_translation_service().translate(
             text=request.text,
             source_language=request.source_language,
             target_language=request.target_language,
         )
 
-        return TextTranslationResponse(
+        return TextTranslationResponse.model_construct(
             success=success,
             translated_text=translated_text,
             source_language=request.source_language,
@@ -147,8 +202,8 @@ async def translate_text_gemini(request: TextTranslationRequest):
         )
 
     except Exception as e:
-        logger.error(f"Text translation endpoint failed: {e}")
-        return TextTranslationResponse(
+        logger.error("Text translation endpoint failed: %s", e)
+        return TextTranslationResponse.model_construct(
             success=False,
             source_language=request.source_language,
             target_language=request.target_language,
@@ -160,9 +215,9 @@ async def translate_text_gemini(request: TextTranslationRequest):
 async def detect_language(request: LanguageDetectionRequest):
     """Detect the language of the given text via Gemini API."""
     try:
-        logger.info(f"Language detection request ({len(request.text)} chars)")
+        logger.info("Language detection request (%d chars)", len(request.text))
 
-        success, detected_language, confidence, error_message = await language_detection_service.detect(
+        success, detected_language, confidence, error_message = await get_language_detection_service().detect(
             text=request.text,
         )
 
@@ -174,8 +229,8 @@ async def detect_language(request: LanguageDetectionRequest):
         )
 
     except Exception as e:
-        logger.error(f"Language detection endpoint failed: {e}")
-        return LanguageDetectionResponse(
+        logger.error("Language detection endpoint failed: %s", e)
+        return LanguageDetectionResponse.model_construct(
             success=False,
             error_message=str(e),
         )
@@ -186,12 +241,14 @@ async def transliterate_text(request: TransliterationRequest):
     """Transliterate text between writing systems via Gemini API."""
     try:
         logger.info(
-            f"Transliteration request: {request.source_script} -> {request.target_script} "
-            f"({len(request.text)} chars)"
+            "Transliteration request: %s -> %s (%d chars)",
+            request.source_script,
+            request.target_script,
+            len(request.text),
         )
 
         success, transliterated_text, source_script, error_message = (
-            await transliteration_service.transliterate(
+            await get_transliteration_service().transliterate(
                 text=request.text,
                 source_script=request.source_script,
                 target_script=request.target_script,
@@ -207,8 +264,8 @@ async def transliterate_text(request: TransliterationRequest):
         )
 
     except Exception as e:
-        logger.error(f"Transliteration endpoint failed: {e}")
-        return TransliterationResponse(
+        logger.error("Transliteration endpoint failed: %s", e)
+        return TransliterationResponse.model_construct(
             success=False,
             source_script=request.source_script,
             target_script=request.target_script,
@@ -219,6 +276,8 @@ async def transliterate_text(request: TransliterationRequest):
 if __name__ == "__main__":
     import uvicorn
 
+    # loop/http stay on "auto": uvicorn uses uvloop and httptools when installed
+    # (see requirements.txt) and falls back to asyncio/h11 elsewhere, e.g. Windows
     uvicorn.run(
         "app.main:app",
         host=settings.host,
@@ -1,26 +1,18 @@
 """
 Pydantic models for API request/response schemas
 """
-from typing import Optional
-from pydantic import BaseModel, Field, validator
+from typing import Annotated, Optional
+from pydantic import BaseModel, Field, StringConstraints
+
+# Whitespace is stripped before the length checks, so blank input is rejected
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+InputText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=5000)]
 
 class TranslationRequest(BaseModel):
     """Request model for translation"""
-    text: str = Field(..., min_length=1, max_length=5000, description="Text to translate")
-    source_language: str = Field(default="English", description="Source language")
-    target_language: str = Field(default="Telugu", description="Target language")
-    
-    @validator('text')
-    def validate_text(cls, v):
-        if not v.strip():
-            raise ValueError('Text cannot be empty or only whitespace')
-        return v.strip()
-    
-    @validator('source_language', 'target_language')
-    def validate_language(cls, v):
-        if not v.strip():
-            raise ValueError('Language cannot be empty')
-        return v.strip()
+    text: InputText = Field(..., description="Text to translate")
+    source_language: NonEmptyStr = Field(default="English", description="Source language")
+    target_language: NonEmptyStr = Field(default="Telugu", description="Target language")
 
 class TranslationResponse(BaseModel):
     """Response model for translation"""
@@ -75,21 +67,9 @@ class SubtitleTranslationResponse(BaseModel):
 
 class TextTranslationRequest(BaseModel):
     """Request model for Gemini-powered text translation"""
-    text: str = Field(..., min_length=1, max_length=5000, description="Text to translate")
+    text: InputText = Field(..., description="Text to translate")
     source_language: str = Field(default="Auto-detect", description="Source language (or 'Auto-detect')")
-    target_language: str = Field(..., description="Target language")
-
-    @validator('text')
-    def validate_text(cls, v):
-        if not v.strip():
-            raise ValueError('Text cannot be empty or only whitespace')
-        return v.strip()
-
-    @validator('target_language')
-    def validate_target_language(cls, v):
-        if not v.strip():
-            raise ValueError('Target language cannot be empty')
-        return v.strip()
+    target_language: NonEmptyStr = Field(..., description="Target language")
 
 class TextTranslationResponse(BaseModel):
     """Response model for Gemini-powered text translation"""
@@ -104,13 +84,7 @@ class TextTranslationResponse(BaseModel):
 
 class LanguageDetectionRequest(BaseModel):
     """Request model for language detection"""
-    text: str = Field(..., min_length=1, max_length=5000, description="Text to detect language of")
-
-    @validator('text')
-    def validate_text(cls, v):
-        if not v.strip():
-            raise ValueError('Text cannot be empty or only whitespace')
-        return v.strip()
+    text: InputText = Field(..., description="Text to detect language of")
 
 class LanguageDetectionResponse(BaseModel):
     """Response model for language detection"""
@@ -124,21 +98,9 @@ class LanguageDetectionResponse(BaseModel):
 
 class TransliterationRequest(BaseModel):
     """Request model for transliteration (script conversion)"""
-    text: str = Field(..., min_length=1, max_length=5000, description="Text to transliterate")
+    text: InputText = Field(..., description="Text to transliterate")
     source_script: str = Field(default="Auto-detect", description="Source script (e.g. 'Devanagari', 'Arabic', or 'Auto-detect')")
-    target_script: str = Field(..., description="Target script (e.g. 'Latin/Roman', 'Devanagari')")
-
-    @validator('text')
-    def validate_text(cls, v):
-        if not v.strip():
-            raise ValueError('Text cannot be empty or only whitespace')
-        return v.strip()
-
-    @validator('target_script')
-    def validate_target_script(cls, v):
-        if not v.strip():
-            raise ValueError('Target script cannot be empty')
-        return v.strip()
+    target_script: NonEmptyStr = Field(..., description="Target script (e.g. 'Latin/Roman', 'Devanagari')")
 
 class TransliterationResponse(BaseModel):
     """Response model for transliteration"""
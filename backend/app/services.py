@@ -2,19 +2,181 @@
 Translation service module
 """
 import asyncio
-import json
 import logging
+import random
 import re
-from typing import Optional
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from itertools import zip_longest
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Optional, TypeVar
 
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 import httpx
+import orjson
 
-from app.config import settings
+from app.config import get_settings
 from app.models import SubtitleCue, TranslatedCue
 
+settings = get_settings()
 logger = logging.getLogger(__name__)
 
+GEMINI_MODEL = "gemini-2.5-flash-lite"
+
+# Markdown code-fence wrappers Gemini sometimes puts around JSON output
+_FENCE_OPEN = re.compile(r"^```(?:json)?\s*\n?")
+_FENCE_CLOSE = re.compile(r"\n?```\s*$")
+
+
+def _strip_fences(text: str) -> str:
+    """Strip surrounding markdown code fences from a Gemini response.
+
+    Handles the usual ```json ... ``` shape with plain string operations;
+    _load_json falls back to the regexes for anything unusual.
+    """
+    cleaned = text.strip()
+    if cleaned.startswith("```"):
+        cleaned = cleaned.removeprefix("```json").removeprefix("```").lstrip("\n")
+        cleaned = cleaned.removesuffix("```")
+    return cleaned.strip()
+
+
+def _strip_fences_regex(text: str) -> str:
+    """Regex-based fence stripping for responses the fast path can't handle."""
+    cleaned = _FENCE_OPEN.sub("", text.strip())
+    cleaned = _FENCE_CLOSE.sub("", cleaned)
+    return cleaned.strip()
+
+
+def _load_json(response_text: str):
+    """Parse JSON from a Gemini response, stripping markdown fences."""
+    try:
+        return orjson.loads(_strip_fences(response_text))
+    except orjson.JSONDecodeError:
+        return orjson.loads(_strip_fences_regex(response_text))
+
+
+# Auth, quota and bad-request errors — another attempt won't help
+_NONRETRYABLE_ERRORS = (
+    google_exceptions.PermissionDenied,
+    google_exceptions.Unauthenticated,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.InvalidArgument,
+)
+# Malformed model output (bad JSON, blocked response), timeouts, dropped connections
+# and transient server-side failures (GatewayTimeout also covers DeadlineExceeded)
+_RETRYABLE_ERRORS = (
+    ValueError,
+    asyncio.TimeoutError,
+    ConnectionError,
+    google_exceptions.InternalServerError,
+    google_exceptions.BadGateway,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.GatewayTimeout,
+)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a failed Gemini call is transient and worth another attempt."""
+    if isinstance(error, _NONRETRYABLE_ERRORS):
+        return False
+    return isinstance(error, _RETRYABLE_ERRORS)
+
+
+T = TypeVar("T")
+
+
+class GeminiClient:
+    """Shared Gemini call path: async generation, response parsing and retries"""
+
+    MAX_RETRIES = 3
+
+    def __init__(self):
+        if not settings.gemini_api_key:
+            raise ValueError("GEMINI_API_KEY is required but not provided")
+        genai.configure(api_key=settings.gemini_api_key)
+        self._model = genai.GenerativeModel(GEMINI_MODEL)
+
+    async def generate_text(self, prompt: str) -> str:
+        """Return the model's plain-text response."""
+        return await self._generate(prompt, str.strip)
+
+    async def generate_json(self, prompt: str, parse: Callable[[str], T] = _load_json) -> T:
+        """Return the model's JSON response, parsed (and optionally validated) by `parse`."""
+        return await self._generate(prompt, parse)
+
+    async def _generate(self, prompt: str, parse: Callable[[str], T]) -> T:
+        """Call Gemini and parse the response, with exponential-backoff retries.
+
+        Parsing happens inside the retry loop so malformed output gets another attempt.
+        """
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                if attempt > 0:
+                    # Full jitter so concurrent callers don't retry in lockstep
+                    wait = random.uniform(0, min(8, 2**attempt))
+                    logger.info("Retry %d/%d after %.1fs", attempt + 1, self.MAX_RETRIES, wait)
+                    await asyncio.sleep(wait)
+
+                response = await self._model.generate_content_async(prompt)
+                return parse(response.text)
+
+            except Exception as e:
+                last_error = e
+                logger.warning("Gemini attempt %d failed: %s", attempt + 1, e)
+                if not _is_retryable(e):
+                    raise
+
+        raise last_error or RuntimeError("Gemini request failed after retries")
+
+
+# One client (and one configured SDK model) shared by all Gemini services
+@lru_cache(maxsize=1)
+def _get_gemini_client() -> GeminiClient:
+    return GeminiClient()
+
+
+class _ResponseCache:
+    """Short-lived in-memory cache that also coalesces identical in-flight requests.
+
+    Concurrent callers with the same key share one underlying call, and successful
+    results are reused for `ttl` seconds. Failures are never cached.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 1024):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    async def get_or_call(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, value = entry
+            if time.monotonic() - stored_at < self._ttl:
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(call())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._store(key, done))
+        # Shielded so one caller disconnecting doesn't cancel the call others are awaiting
+        return await asyncio.shield(task)
+
+    def _store(self, key: Hashable, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._entries[key] = (time.monotonic(), task.result())
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
 
 class TranslationService:
     """Service for handling text translation requests via Chipp AI"""
@@ -28,6 +190,17 @@ class TranslationService:
         if not self.api_key:
             raise ValueError("API key is required but not provided")
 
+        # One pooled client for the process lifetime — keeps TLS sessions alive between requests
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+            http2=True,
+        )
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client. Called on application shutdown."""
+        await self._client.aclose()
+
     async def translate(
         self,
         text: str,
@@ -51,28 +224,29 @@ class TranslationService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(self.base_url, headers=headers, json=data)
-
-                if response.status_code == 200:
-                    result = response.json()
-                    if "choices" in result and len(result["choices"]) > 0:
-                        translation = (
-                            result["choices"][0]
-                            .get("message", {})
-                            .get("content", "")
-                            .strip()
-                        )
-                        logger.info(f"Translation successful: {source_language} -> {target_language}")
-                        return True, translation, None
-                    else:
-                        error_msg = f"No translation in response: {result}"
-                        logger.error(error_msg)
-                        return False, None, error_msg
+            response = await self._client.post(self.base_url, headers=headers, json=data)
+
+            if response.status_code == 200:
+                result = response.json()
+                if "choices" in result and len(result["choices"]) > 0:
+                    translation = (
+                        result["choices"][0]
+                        .get("message", {})
+                        .get("content", "")
+                        .strip()
+                    )
+                    logger.info(
+                        "Translation successful: %s -> %s", source_language, target_language
+                    )
+                    return True, translation, None
                 else:
-                    error_msg = f"API call failed with status {response.status_code}: {response.text}"
+                    error_msg = f"No translation in response: {result}"
                     logger.error(error_msg)
                     return False, None, error_msg
+            else:
+                error_msg = f"API call failed with status {response.status_code}: {response.text}"
+                logger.error(error_msg)
+                return False, None, error_msg
 
         except httpx.TimeoutException:
             error_msg = "Translation request timed out"
@@ -91,14 +265,14 @@ class TranslationService:
 class SubtitleTranslationService:
     """Service for translating subtitle cues via Google Gemini API"""
 
-    MODEL = "gemini-2.5-flash-lite"
-    MAX_RETRIES = 3
+    # Batches one request may have in flight, so a large upload can't take every
+    # shared Gemini slot and stall subtitle requests that arrive after it
+    MAX_BATCHES_IN_FLIGHT = 4
 
     def __init__(self):
-        if not settings.gemini_api_key:
-            raise ValueError("GEMINI_API_KEY is required but not provided")
-        genai.configure(api_key=settings.gemini_api_key)
-        self.model = genai.GenerativeModel(self.MODEL)
+        self._client = _get_gemini_client()
+        # Shared by every request on this singleton, so it caps in-flight Gemini calls per process
+        self._gemini_slots = asyncio.Semaphore(settings.gemini_max_concurrency)
 
     async def translate_subtitles(
         self,
@@ -108,49 +282,62 @@ class SubtitleTranslationService:
         batch_size: int = 25,
     ) -> list[TranslatedCue]:
         """Translate all cues, splitting into batches."""
-        batches = [cues[i : i + batch_size] for i in range(0, len(cues), batch_size)]
         all_translated: list[TranslatedCue] = []
-
-        logger.info(
-            f"Translating {len(cues)} cues ({source_language} -> {target_language}) "
-            f"in {len(batches)} batches"
-        )
-
-        for batch_idx, batch in enumerate(batches):
-            logger.info(f"Batch {batch_idx + 1}/{len(batches)} ({len(batch)} cues)")
-            translated = await self._translate_batch_with_retry(
-                batch, source_language, target_language
-            )
+        async for translated in self.translate_subtitles_iter(
+            cues, source_language, target_language, batch_size
+        ):
             all_translated.extend(translated)
-
         return all_translated
 
-    async def _translate_batch_with_retry(
+    async def translate_subtitles_iter(
         self,
         cues: list[SubtitleCue],
-        source_lang: str,
-        target_lang: str,
-    ) -> list[TranslatedCue]:
-        """Translate a single batch with exponential-backoff retries."""
-        last_error: Optional[Exception] = None
+        source_language: str,
+        target_language: str,
+        batch_size: int = 25,
+    ) -> AsyncIterator[list[TranslatedCue]]:
+        """Translate cues in batches, yielding each batch in order as it becomes available."""
+        batches = [cues[i : i + batch_size] for i in range(0, len(cues), batch_size)]
 
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                if attempt > 0:
-                    wait = 2**attempt
-                    logger.info(f"Retry {attempt + 1}/{self.MAX_RETRIES} after {wait}s")
-                    await asyncio.sleep(wait)
+        logger.info(
+            "Translating %d cues (%s -> %s) in %d batches",
+            len(cues),
+            source_language,
+            target_language,
+            len(batches),
+        )
 
-                return await self._translate_batch(cues, source_lang, target_lang)
+        async def _run(batch_idx: int, batch: list[SubtitleCue]) -> list[TranslatedCue]:
+            async with self._gemini_slots:
+                logger.info("Batch %d/%d (%d cues)", batch_idx + 1, len(batches), len(batch))
+                return await self._translate_batch(batch, source_language, target_language)
 
-            except Exception as e:
-                last_error = e
-                logger.warning(f"Batch attempt {attempt + 1} failed: {e}")
-                # Don't retry on auth / quota errors
-                if "API key" in str(e) or "quota" in str(e):
-                    raise
+        # Batches are independent, so run a window of them concurrently. The next batch
+        # only starts once the consumer has taken one, so a slow reader holds back work
+        # and at most `window` finished batches are buffered.
+        window = min(settings.gemini_max_concurrency, self.MAX_BATCHES_IN_FLIGHT)
+        upcoming = iter(enumerate(batches))
+        pending: deque[asyncio.Task] = deque()
+
+        def _start_next() -> None:
+            nxt = next(upcoming, None)
+            if nxt is not None:
+                pending.append(asyncio.create_task(_run(*nxt)))
 
-        raise last_error or RuntimeError("Translation failed after retries")
+        for _ in range(window):
+            _start_next()
+
+        try:
+            # Await in submission order so cue order is preserved
+            while pending:
+                translated = await pending[0]
+                pending.popleft()
+                yield translated
+                _start_next()
+        finally:
+            # Stop outstanding batches if one failed or the consumer went away
+            for task in pending:
+                task.cancel()
 
     async def _translate_batch(
         self,
@@ -162,23 +349,23 @@ class SubtitleTranslationService:
         texts = [cue.text for cue in cues]
         prompt = self._build_prompt(texts, source_lang, target_lang)
 
-        # Gemini SDK is synchronous — run in a thread to avoid blocking the event loop
-        response = await asyncio.to_thread(
-            self.model.generate_content, prompt
-        )
-        translated_texts = self._parse_response(response.text)
-
-        # Build TranslatedCue list, falling back to original text if missing
-        result: list[TranslatedCue] = []
-        for idx, cue in enumerate(cues):
-            translated_text = translated_texts[idx] if idx < len(translated_texts) else cue.text
-            result.append(
-                TranslatedCue(id=cue.id, text=cue.text, translated_text=translated_text)
+        translated_texts = await self._client.generate_json(prompt, self._parse_response)
+
+        # Build TranslatedCue list, falling back to original text if missing. Fields are
+        # already strings, so model_construct skips re-validating every cue.
+        return [
+            TranslatedCue.model_construct(
+                id=cue.id,
+                text=cue.text,
+                translated_text=translated if isinstance(translated, str) else cue.text,
             )
-        return result
+            for cue, translated in zip_longest(cues, translated_texts[: len(cues)])
+        ]
 
     @staticmethod
-    def _build_prompt(texts: list[str], source_lang: str, target_lang: str) -> str:
+    @lru_cache(maxsize=64)
+    def _prompt_header(source_lang: str, target_lang: str) -> str:
+        """Instruction block for a language pair — identical for every batch."""
         return (
             f"You are a professional subtitle translator. "
             f"Translate the following subtitle texts from {source_lang} to {target_lang}.\n\n"
@@ -189,23 +376,32 @@ class SubtitleTranslationService:
             "- Keep the same tone and context\n"
             "- Do NOT add explanations or comments\n"
             "- Return ONLY a JSON array of translated strings\n\n"
-            f"Input ({len(texts)} subtitles):\n"
-            f"{json.dumps(texts, ensure_ascii=False, indent=2)}\n\n"
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _prompt_footer(count: int) -> str:
+        """Output-format block — depends only on the batch size."""
+        return (
             f"Output format:\n"
-            f'Return a JSON array with {len(texts)} translated strings in the same order.\n\n'
+            f'Return a JSON array with {count} translated strings in the same order.\n\n'
             f'Example:\n["Translated text 1", "Translated text 2", ...]'
         )
 
+    @classmethod
+    def _build_prompt(cls, texts: list[str], source_lang: str, target_lang: str) -> str:
+        return (
+            cls._prompt_header(source_lang, target_lang)
+            + f"Input ({len(texts)} subtitles):\n"
+            + orjson.dumps(texts, option=orjson.OPT_INDENT_2).decode()
+            + "\n\n"
+            + cls._prompt_footer(len(texts))
+        )
+
     @staticmethod
     def _parse_response(response_text: str) -> list[str]:
         """Parse JSON array from Gemini response, stripping markdown fences."""
-        cleaned = response_text.strip()
-        # Strip markdown code block wrappers
-        cleaned = re.sub(r"^```(?:json)?\s*\n?", "", cleaned)
-        cleaned = re.sub(r"\n?```\s*$", "", cleaned)
-        cleaned = cleaned.strip()
-
-        parsed = json.loads(cleaned)
+        parsed = _load_json(response_text)
         if not isinstance(parsed, list):
             raise ValueError("Response is not a JSON array")
         return parsed
@@ -214,13 +410,9 @@ class SubtitleTranslationService:
 class TextTranslationService:
     """Service for translating plain text via Google Gemini API"""
 
-    MODEL = "gemini-2.5-flash-lite"
-
     def __init__(self):
-        if not settings.gemini_api_key:
-            raise ValueError("GEMINI_API_KEY is required but not provided")
-        genai.configure(api_key=settings.gemini_api_key)
-        self.model = genai.GenerativeModel(self.MODEL)
+        self._client = _get_gemini_client()
+        self._cache = _ResponseCache()
 
     async def translate(
         self,
@@ -244,11 +436,13 @@ class TextTranslationService:
         )
 
         try:
-            response = await asyncio.to_thread(
-                self.model.generate_content, prompt
+            translated = await self._cache.get_or_call(
+                (source_language, target_language, text),
+                lambda: self._client.generate_text(prompt),
+            )
+            logger.info(
+                "Text translation successful: %s -> %s", source_language, target_language
             )
-            translated = response.text.strip()
-            logger.info(f"Text translation successful: {source_language} -> {target_language}")
             return True, translated, None
 
         except Exception as e:
@@ -260,35 +454,32 @@ class TextTranslationService:
 class LanguageDetectionService:
     """Service for detecting the language of text via Google Gemini API"""
 
-    MODEL = "gemini-2.5-flash-lite"
+    PROMPT_PREFIX = (
+        "You are a language identification expert. "
+        "Detect the language of the following text.\n\n"
+        "INSTRUCTIONS:\n"
+        "- Return ONLY a JSON object with two keys: \"language\" and \"confidence\"\n"
+        "- \"language\" should be the full English name of the language (e.g. \"Spanish\", \"Japanese\")\n"
+        "- \"confidence\" should be a float between 0 and 1 indicating how confident you are\n"
+        "- Do NOT add any explanation or text outside the JSON\n\n"
+        "Text:\n"
+    )
 
     def __init__(self):
-        if not settings.gemini_api_key:
-            raise ValueError("GEMINI_API_KEY is required but not provided")
-        genai.configure(api_key=settings.gemini_api_key)
-        self.model = genai.GenerativeModel(self.MODEL)
+        self._client = _get_gemini_client()
+        self._cache = _ResponseCache()
 
     async def detect(self, text: str) -> tuple[bool, Optional[str], Optional[float], Optional[str]]:
         """Detect the language of the given text.
         Returns (success, detected_language, confidence, error_message).
         """
-        prompt = (
-            "You are a language identification expert. "
-            "Detect the language of the following text.\n\n"
-            "INSTRUCTIONS:\n"
-            "- Return ONLY a JSON object with two keys: \"language\" and \"confidence\"\n"
-            "- \"language\" should be the full English name of the language (e.g. \"Spanish\", \"Japanese\")\n"
-            "- \"confidence\" should be a float between 0 and 1 indicating how confident you are\n"
-            "- Do NOT add any explanation or text outside the JSON\n\n"
-            f"Text:\n{text}"
-        )
+        prompt = self.PROMPT_PREFIX + text
 
         try:
-            response = await asyncio.to_thread(
-                self.model.generate_content, prompt
+            result = await self._cache.get_or_call(
+                text, lambda: self._client.generate_json(prompt, self._parse_response)
             )
-            result = self._parse_response(response.text)
-            logger.info(f"Language detection: {result['language']} ({result['confidence']})")
+            logger.info("Language detection: %s (%s)", result["language"], result["confidence"])
             return True, result["language"], result["confidence"], None
 
         except Exception as e:
@@ -299,44 +490,36 @@ class LanguageDetectionService:
     @staticmethod
     def _parse_response(response_text: str) -> dict:
         """Parse JSON from Gemini response."""
-        cleaned = response_text.strip()
-        cleaned = re.sub(r"^```(?:json)?\s*\n?", "", cleaned)
-        cleaned = re.sub(r"\n?```\s*$", "", cleaned)
-        cleaned = cleaned.strip()
-
-        parsed = json.loads(cleaned)
+        parsed = _load_json(response_text)
         if not isinstance(parsed, dict) or "language" not in parsed or "confidence" not in parsed:
             raise ValueError("Response must be a JSON object with 'language' and 'confidence' keys")
+        # Checked here, not only in the response model, so bad output is retried and never cached
+        if not isinstance(parsed["language"], str):
+            raise ValueError("'language' must be a string")
+        confidence = parsed["confidence"]
+        if isinstance(confidence, bool) or not isinstance(confidence, (int, float)) or not 0 <= confidence <= 1:
+            raise ValueError("'confidence' must be a number between 0 and 1")
         return parsed
 
 
 class TransliterationService:
     """Service for transliterating text between scripts via Google Gemini API"""
 
-    MODEL = "gemini-2.5-flash-lite"
-
     def __init__(self):
-        if not settings.gemini_api_key:
-            raise ValueError("GEMINI_API_KEY is required but not provided")
-        genai.configure(api_key=settings.gemini_api_key)
-        self.model = genai.GenerativeModel(self.MODEL)
+        self._client = _get_gemini_client()
+        self._cache = _ResponseCache()
 
-    async def transliterate(
-        self,
-        text: str,
-        source_script: str,
-        target_script: str,
-    ) -> tuple[bool, Optional[str], Optional[str], Optional[str]]:
-        """Transliterate text between scripts.
-        Returns (success, transliterated_text, detected_source_script, error_message).
-        """
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _prompt_header(source_script: str, target_script: str) -> str:
+        """Everything in the prompt before the input text, per script pair."""
         source_instruction = (
             f"The text is written in {source_script} script. "
             if source_script != "Auto-detect"
             else "First identify the script/writing system of the text. "
         )
 
-        prompt = (
+        return (
             "You are a professional transliteration expert with deep knowledge of writing systems worldwide.\n\n"
             f"{source_instruction}"
             f"Transliterate the following text into {target_script}.\n\n"
@@ -355,16 +538,27 @@ class TransliterationService:
             "Return ONLY a JSON object with these keys:\n"
             '- "source_script": the detected or confirmed source script name (e.g. "Devanagari", "Arabic", "Katakana")\n'
             '- "result": the transliterated text\n\n'
-            f"Text to transliterate:\n{text}"
+            "Text to transliterate:\n"
         )
 
+    async def transliterate(
+        self,
+        text: str,
+        source_script: str,
+        target_script: str,
+    ) -> tuple[bool, Optional[str], Optional[str], Optional[str]]:
+        """Transliterate text between scripts.
+        Returns (success, transliterated_text, detected_source_script, error_message).
+        """
+        prompt = self._prompt_header(source_script, target_script) + text
+
         try:
-            response = await asyncio.to_thread(
-                self.model.generate_content, prompt
+            result = await self._cache.get_or_call(
+                (source_script, target_script, text),
+                lambda: self._client.generate_json(prompt, self._parse_response),
             )
-            result = self._parse_response(response.text)
             logger.info(
-                f"Transliteration successful: {result['source_script']} -> {target_script}"
+                "Transliteration successful: %s -> %s", result["source_script"], target_script
             )
             return True, result["result"], result["source_script"], None
 
@@ -376,20 +570,33 @@ class TransliterationService:
     @staticmethod
     def _parse_response(response_text: str) -> dict:
         """Parse JSON from Gemini response."""
-        cleaned = response_text.strip()
-        cleaned = re.sub(r"^```(?:json)?\s*\n?", "", cleaned)
-        cleaned = re.sub(r"\n?```\s*$", "", cleaned)
-        cleaned = cleaned.strip()
-
-        parsed = json.loads(cleaned)
+        parsed = _load_json(response_text)
         if not isinstance(parsed, dict) or "result" not in parsed or "source_script" not in parsed:
             raise ValueError("Response must be a JSON object with 'result' and 'source_script' keys")
         return parsed
 
 
-# Global service instances
-translation_service = TranslationService()
-subtitle_translation_service = SubtitleTranslationService()
-text_translation_service = TextTranslationService()
-language_detection_service = LanguageDetectionService()
-transliteration_service = TransliterationService()
+# Service instances — built on first use so importing this module stays cheap
+@lru_cache(maxsize=1)
+def get_translation_service() -> TranslationService:
+    return TranslationService()
+
+
+@lru_cache(maxsize=1)
+def get_subtitle_translation_service() -> SubtitleTranslationService:
+    return SubtitleTranslationService()
+
+
+@lru_cache(maxsize=1)
+def get_text_translation_service() -> TextTranslationService:
+    return TextTranslationService()
+
+
+@lru_cache(maxsize=1)
+def get_language_detection_service() -> LanguageDetectionService:
+    return LanguageDetectionService()
+
+
+@lru_cache(maxsize=1)
+def get_transliteration_service() -> TransliterationService:
+    return TransliterationService()
@@ -6,7 +6,9 @@ Entry point for the translation service
 
 import uvicorn
 from app.main import app
-from app.config import settings
+from app.config import get_settings
+
+settings = get_settings()
 
 def main():
     """Run the FastAPI application"""
@@ -15,6 +17,8 @@ def main():
     print(f"API documentation: http://{settings.host}:{settings.port}/docs")
     print(f"Debug mode: {settings.debug}")
     
+    # loop/http stay on "auto": uvicorn uses uvloop and httptools when installed
+    # (see requirements.txt) and falls back to asyncio/h11 elsewhere, e.g. Windows
     uvicorn.run(
         "app.main:app",
         host=settings.host,